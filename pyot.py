@@ -52,16 +52,17 @@ def main() -> None:
             config.auth_recipe_writer.TOPIC, handler=AuthRecipeHandler.handle
         )
 
-    # Start client and run until interrupted
+    # Start client and heartbeat, then run until interrupted
     try:
         client.start()
+        tracker.start()
         log.debug("Press Ctrl+C to exit")
         while True:
-            tracker.track()
             time.sleep(config.SLEEP_INTERVAL)
     except KeyboardInterrupt:
         log.debug("Shutting down")
     finally:
+        tracker.stop()
         client.stop()
 
 
@@ -87,7 +87,7 @@ class PushToServerHandler(BaseHandler):
         if config.centralize_logs:
             cls.logger.debug("PushToServerHandler: including log processing steps")
             cls.logger.debug(
-                f"PushToServerHandler: log folder name: {config.log_folder_name}"
+                "PushToServerHandler: log folder name: %s", config.log_folder_name
             )
         else:
             cls.logger.debug("PushToServerHandler: skipping log processing steps")
@@ -164,9 +164,10 @@ class PushToServerHandler(BaseHandler):
                 f"{cls.config.remote_path}{socket.gethostname()}/",
             ]
         )
-        cls.logger.debug(
-            "PushToServerHandler: starting remote mkdir: %s", shlex.join(cmd)
-        )
+        if cls.logger.isEnabledFor(logging.DEBUG):
+            cls.logger.debug(
+                "PushToServerHandler: starting remote mkdir: %s", shlex.join(cmd)
+            )
         try:
             subprocess.check_call(cmd)
             cls.logger.debug("PushToServerHandler: mkdir successful")
@@ -206,7 +207,8 @@ class PushToServerHandler(BaseHandler):
                 f"{cls.config.remote_server}:{cls.config.remote_path}{socket.gethostname()}/",
             ]
         )
-        cls.logger.debug("PushToServerHandler: starting rsync: %s", shlex.join(cmd))
+        if cls.logger.isEnabledFor(logging.DEBUG):
+            cls.logger.debug("PushToServerHandler: starting rsync: %s", shlex.join(cmd))
         try:
             subprocess.check_call(cmd)
             cls.logger.debug("PushToServerHandler: rsync successful")
@@ -237,9 +239,10 @@ class PushToServerHandler(BaseHandler):
                 f"{cls.config.remote_log_path}{cls.config.log_folder_name}/",
             ]
         )
-        cls.logger.debug(
-            "PushToServerHandler: starting remote mkdir: %s", shlex.join(cmd)
-        )
+        if cls.logger.isEnabledFor(logging.DEBUG):
+            cls.logger.debug(
+                "PushToServerHandler: starting remote mkdir: %s", shlex.join(cmd)
+            )
         try:
             subprocess.check_call(cmd)
             cls.logger.debug("PushToServerHandler: mkdir successful")
@@ -280,9 +283,10 @@ class PushToServerHandler(BaseHandler):
                 f"{cls.config.remote_log_path}{cls.config.log_folder_name}/",
             ]
         )
-        cls.logger.debug(
-            "PushToServerHandler: starting remote rsync: %s", shlex.join(cmd)
-        )
+        if cls.logger.isEnabledFor(logging.DEBUG):
+            cls.logger.debug(
+                "PushToServerHandler: starting remote rsync: %s", shlex.join(cmd)
+            )
         try:
             subprocess.check_call(cmd)
             cls.logger.debug("PushToServerHandler: rsync successful")
@@ -313,9 +317,10 @@ class PushToServerHandler(BaseHandler):
                 f"{cls.config.remote_log_path}{cls.config.log_folder_name}/",
             ]
         )
-        cls.logger.debug(
-            "PushToServerHandler: starting remote synoacltool: %s", shlex.join(cmd)
-        )
+        if cls.logger.isEnabledFor(logging.DEBUG):
+            cls.logger.debug(
+                "PushToServerHandler: starting remote synoacltool: %s", shlex.join(cmd)
+            )
         try:
             subprocess.check_call(cmd)
             cls.logger.debug("PushToServerHandler: synoacltool successful")
@@ -347,9 +352,10 @@ class PushToServerHandler(BaseHandler):
                 f"{cls.config.remote_path}{socket.gethostname()}/",
             ]
         )
-        cls.logger.debug(
-            "PushToServerHandler: starting remote synoacltool: %s", shlex.join(cmd)
-        )
+        if cls.logger.isEnabledFor(logging.DEBUG):
+            cls.logger.debug(
+                "PushToServerHandler: starting remote synoacltool: %s", shlex.join(cmd)
+            )
         try:
             subprocess.check_call(cmd)
             cls.logger.debug("PushToServerHandler: synoacltool successful")
@@ -427,9 +433,10 @@ class SyncShopOrderRecipesHandler(BaseHandler):
                 cls.config.local_path,
             ]
         )
-        cls.logger.debug(
-            "SyncShopOrderRecipesHandler: starting rsync: %s", shlex.join(cmd)
-        )
+        if cls.logger.isEnabledFor(logging.DEBUG):
+            cls.logger.debug(
+                "SyncShopOrderRecipesHandler: starting rsync: %s", shlex.join(cmd)
+            )
         try:
             subprocess.check_call(cmd)
             cls.logger.debug("SyncShopOrderRecipesHandler: rsync successful")
@@ -593,16 +600,26 @@ class AuthRecipeHandler(BaseHandler):
         try:
             employees = cls._fetch_employees()
             path = os.path.join(cls.config.folder, cls.config.filename)
+
+            # Employee blocks are identical for every controller, so build once
+            pin_lines = "".join(
+                f"{emp.employee_number}:{emp.user_pin}\n" for emp in employees
+            )
+            name_lines = "".join(
+                f"{emp.employee_number}:{emp.employee_name}\n" for emp in employees
+            )
             with open(path, "w") as f:
                 for controller in cls.config.controllers:
-                    f.write(f"{controller}:String Table.{cls.config.PIN_TABLE_NAME}\n")
-                    for emp in employees:
-                        f.write(f"{emp.employee_number}:{emp.user_pin}\n")
-                    f.write("\n")
-                    f.write(f"{controller}:String Table.{cls.config.NAME_TABLE_NAME}\n")
-                    for emp in employees:
-                        f.write(f"{emp.employee_number}:{emp.employee_name}\n")
-                    f.write("\n")
+                    f.writelines(
+                        (
+                            f"{controller}:String Table.{cls.config.PIN_TABLE_NAME}\n",
+                            pin_lines,
+                            "\n",
+                            f"{controller}:String Table.{cls.config.NAME_TABLE_NAME}\n",
+                            name_lines,
+                            "\n",
+                        )
+                    )
                 f.write("\n")
             cls.logger.debug("AuthRecipeHandler: wrote auth recipe")
             return True
@@ -5,17 +5,29 @@ import shutil
 import socket
 import subprocess
 import csv
+import heapq
+import warnings
 from abc import ABC, abstractmethod
+from copy import copy
+from dataclasses import dataclass
 from datetime import date, datetime
+from operator import itemgetter
 from pathlib import Path
 from zoneinfo import ZoneInfo
-from typing import Optional, List, Dict
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, List, Dict
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
 from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.formatting.rule import CellIsRule
+from openpyxl.formatting.rule import FormulaRule
+
+# Cell alignments shared by every hoist export cell
+_ALIGN_LEFT = Alignment(horizontal="left", vertical="center")
+_ALIGN_CENTER = Alignment(horizontal="center", vertical="center")
+_ALIGN_RIGHT = Alignment(horizontal="right", vertical="center")
 
 
 class AmpHourAggregator:
@@ -107,17 +119,9 @@ class AmpHourAggregator:
                 self._safe_get(raw, spec.indices.get("time_out")),
             )
         else:
-            try:
-                date_part, time_part = self._safe_get(raw, spec.indices.get("dt_out")).split()
-                month, day, year = map(int, date_part.split("/"))
-                reformatted_date = f"{year % 100:02d}{month:02d}{day:02d}"
-                reformatted_time = time_part.replace(":", "")
-                unloaded_dt = self._parse_timestamp(
-                    reformatted_date,
-                    reformatted_time,
-                )
-            except Exception:
-                unloaded_dt = None
+            unloaded_dt = self._parse_datetime_text(
+                self._safe_get(raw, spec.indices.get("dt_out"))
+            )
 
         if not unloaded_dt:
             return None
@@ -214,15 +218,44 @@ class AmpHourAggregator:
         Returns:
             Optional[datetime]: Parsed datetime or None if parsing fails.
         """
-        if not date_str or not time_str:
+        if len(date_str) != 6 or not date_str.isdecimal():
             return None
+        if not time_str or len(time_str) > 6 or not time_str.isdecimal():
+            return None
+
+        # Fields are split off numerically rather than going through strptime,
+        # which also left-pads short times; two-digit years follow the same
+        # 1969-2068 pivot as %y.
+        year, rest = divmod(int(date_str), 10000)
+        month, day = divmod(rest, 100)
+        hour, rest = divmod(int(time_str), 10000)
+        minute, second = divmod(rest, 100)
+        year += 2000 if year < 69 else 1900
         try:
-            while len(time_str) < 6:
-                time_str = "0" + time_str
-            return datetime.strptime(f"{date_str}{time_str}", "%y%m%d%H%M%S")
+            return datetime(year, month, day, hour, minute, second)
         except ValueError:
             return None
 
+    @staticmethod
+    def _parse_datetime_text(value: str) -> Optional[datetime]:
+        """Parse an M/D/YYYY H:MM:SS timestamp into a datetime.
+
+        Args:
+            value (str): Date/time string, e.g. "3/7/2024 6:05:09".
+
+        Returns:
+            Optional[datetime]: Parsed datetime or None if parsing fails.
+        """
+        try:
+            date_part, time_part = value.split()
+            month, day, year = map(int, date_part.split("/"))
+            hour, minute, second = map(int, time_part.split(":"))
+            if year < 100:
+                year += 2000 if year < 69 else 1900
+            return datetime(year, month, day, hour, minute, second)
+        except (ValueError, OverflowError):
+            return None
+
     def _format_datetime(self, dt: datetime) -> str:
         """Format a datetime for CSV output.
 
@@ -235,6 +268,95 @@ class AmpHourAggregator:
         return dt.strftime(self.OUTPUT_DATE_FORMAT)
 
 
+@dataclass(frozen=True, slots=True)
+class ResolvedIndices:
+    """Column indices of a HoistAggregationSpec, resolved once per source file.
+
+    Attributes:
+        shop_order (Optional[int]): Shop order column.
+        date_in (Optional[int]): Load date column (YYMMDD).
+        time_in (Optional[int]): Load time column (HHMMSS).
+        dt_in (Optional[int]): Combined load date/time column (m/d/Y H:M:S).
+        date_out (Optional[int]): Unload date column (YYMMDD).
+        time_out (Optional[int]): Unload time column (HHMMSS).
+        dt_out (Optional[int]): Combined unload date/time column (m/d/Y H:M:S).
+        station (Optional[int]): Station number column.
+        customer (Optional[int]): Customer column.
+        part (Optional[int]): Part ID column.
+        load (Optional[int]): Load number column.
+        barrel (Optional[int]): Barrel number column.
+        target_ah (Optional[int]): Target amp hours column.
+        actual_ah (Optional[int]): Actual amp hours column.
+        ah_pct (Optional[int]): Amp hours percent column.
+        barrel_speed (Optional[int]): Barrel speed column.
+        target_weight (Optional[int]): Target weight column.
+        actual_weight (Optional[int]): Actual weight column.
+        has_date_time_in (bool): Whether load time comes from date_in/time_in
+            rather than dt_in.
+        has_date_time_out (bool): Whether unload time comes from
+            date_out/time_out rather than dt_out.
+        derive_actual_ah (bool): Whether actual amp hours are derived from
+            target amp hours and amp hours percent.
+    """
+
+    shop_order: Optional[int]
+    date_in: Optional[int]
+    time_in: Optional[int]
+    dt_in: Optional[int]
+    date_out: Optional[int]
+    time_out: Optional[int]
+    dt_out: Optional[int]
+    station: Optional[int]
+    customer: Optional[int]
+    part: Optional[int]
+    load: Optional[int]
+    barrel: Optional[int]
+    target_ah: Optional[int]
+    actual_ah: Optional[int]
+    ah_pct: Optional[int]
+    barrel_speed: Optional[int]
+    target_weight: Optional[int]
+    actual_weight: Optional[int]
+    has_date_time_in: bool
+    has_date_time_out: bool
+    derive_actual_ah: bool
+
+    @classmethod
+    def from_spec(cls, spec) -> "ResolvedIndices":
+        """Resolve the indices of a hoist aggregation spec.
+
+        Args:
+            spec (HoistAggregationSpec): Spec whose indices should be resolved.
+
+        Returns:
+            ResolvedIndices: Resolved column indices and input variant flags.
+        """
+        indices = spec.indices
+        return cls(
+            shop_order=indices.get("shop_order"),
+            date_in=indices.get("date_in"),
+            time_in=indices.get("time_in"),
+            dt_in=indices.get("dt_in"),
+            date_out=indices.get("date_out"),
+            time_out=indices.get("time_out"),
+            dt_out=indices.get("dt_out"),
+            station=indices.get("station"),
+            customer=indices.get("customer"),
+            part=indices.get("part"),
+            load=indices.get("load"),
+            barrel=indices.get("barrel"),
+            target_ah=indices.get("target_ah"),
+            actual_ah=indices.get("actual_ah"),
+            ah_pct=indices.get("ah_pct"),
+            barrel_speed=indices.get("barrel_speed"),
+            target_weight=indices.get("target_weight"),
+            actual_weight=indices.get("actual_weight"),
+            has_date_time_in="date_in" in indices and "time_in" in indices,
+            has_date_time_out="date_out" in indices and "time_out" in indices,
+            derive_actual_ah="actual_ah" not in indices.values(),
+        )
+
+
 class HoistAggregator:
     """Aggregates hoist CSV data into a single master CSV file.
 
@@ -250,6 +372,28 @@ class HoistAggregator:
 
     OUTPUT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+    """Output CSV columns, in the order values appear in each row tuple."""
+    FIELDNAMES = (
+        "Hoist #",
+        "Lane Number",
+        "Station Number",
+        "Station Type",
+        "Date/Time Loaded",
+        "Date/Time Unloaded",
+        "Duration",
+        "Customer",
+        "Part ID",
+        "Shop Order",
+        "Load Number",
+        "Barrel Number",
+        "Target Amp Hours",
+        "Actual Amp Hours",
+        "Amp Hours Percent",
+        "Barrel Speed",
+        "Target Weight",
+        "Actual Weight",
+    )
+
     def __init__(self, config) -> None:
         """Initialize the hoist aggregator.
 
@@ -268,113 +412,126 @@ class HoistAggregator:
         if not self.config.enabled:
             return
 
-        rows = self._collect_rows()
-        rows.sort(key=lambda r: r["_sort"])
-        self._write_output(rows)
+        self._write_output(self.iter_rows())
 
-    def _collect_rows(self) -> list[dict]:
+    def iter_rows(self) -> Iterator[tuple[str, ...]]:
+        """Aggregate all configured hoist data files into output rows.
+
+        Rows are the same string values the CSV output holds, so they can be fed
+        to HoistExcelExporter.write without writing the CSV file first.
+
+        Yields:
+            tuple[str, ...]: FIELDNAMES, then each row's values in order of
+                unload timestamp.
+        """
+        yield self.FIELDNAMES
+
+        # Each file is sorted on its own and the sorted files are merged while
+        # writing, instead of sorting one combined list. The merge is stable,
+        # so rows with equal timestamps keep their file and row order.
+        rows = heapq.merge(*self._collect_rows(), key=itemgetter(0))
+        yield from map(itemgetter(1), rows)
+
+    def _collect_rows(self) -> list[list[tuple[datetime, tuple]]]:
         """Collect normalized rows from all configured hoist data files.
 
         Iterates over each HoistAggregationSpec in the configuration, reads the
-        corresponding CSV file, and processes each row.
+        corresponding CSV file, processes each row, and sorts the file's rows by
+        unload timestamp.
 
         Returns:
-            list[dict]: List of normalized row dictionaries.
+            list[list[tuple[datetime, tuple]]]: Unload timestamp and normalized
+                row values for each row, sorted, for each source file.
         """
-        rows: list[dict] = []
+        rows_by_file: list[list[tuple[datetime, tuple]]] = []
 
         for spec in self.config.files:
+            # Station types for this file's lane, keyed by station number only
+            lane_types = {
+                station: station_type
+                for (lane, station), station_type in self.config.station_types.items()
+                if lane == spec.lane
+            }
+            indices = ResolvedIndices.from_spec(spec)
+            rows: list[tuple[datetime, tuple]] = []
+
             with spec.path.open(newline="", encoding="utf-8") as f:
                 reader = csv.reader(f)
                 next(reader, None)  # skip header row
 
                 for raw in reader:
-                    row = self._process_row(raw, spec)
+                    row = self._process_row(raw, spec, indices, lane_types)
                     if row is not None:
                         rows.append(row)
 
-        return rows
+            rows.sort(key=itemgetter(0))
+            rows_by_file.append(rows)
+
+        return rows_by_file
 
     def _process_row(
         self,
         raw: list[str],
         spec,
-    ) -> Optional[dict]:
+        indices: ResolvedIndices,
+        lane_types: dict[int, str],
+    ) -> Optional[tuple[datetime, tuple]]:
         """Process a single CSV row for a given hoist specification.
 
         Applies filtering rules, parses timestamps, derives duration and station
-        type, and returns a normalized row dictionary. Rows that do not meet
-        validation or filtering criteria are discarded.
+        type, and returns the normalized row values in FIELDNAMES order. Rows that
+        do not meet validation or filtering criteria are discarded.
 
         Args:
             raw (list[str]): Raw CSV row values.
             spec (HoistAggregationSpec): Specification describing how to interpret
                 the row.
+            indices (ResolvedIndices): Column indices resolved from spec.
+            lane_types (dict[int, str]): Station types for the spec's lane, keyed
+                by station number.
 
         Returns:
-            Optional[dict]: Normalized row dictionary, or None if the row should
-                be skipped.
+            Optional[tuple[datetime, tuple]]: Unload timestamp used for sorting
+                and the normalized row values, or None if the row should be
+                skipped.
         """
-        shop_order = self._safe_get(raw, spec.indices.get("shop_order"))
+        shop_order = self._safe_get(raw, indices.shop_order)
         if shop_order in ("", "0", "111"):
             return None
         
-        if "date_in" in spec.indices and "time_in" in spec.indices:
+        if indices.has_date_time_in:
             loaded_dt = self._parse_timestamp(
-                self._safe_get(raw, spec.indices.get("date_in")),
-                self._safe_get(raw, spec.indices.get("time_in")),
+                self._safe_get(raw, indices.date_in),
+                self._safe_get(raw, indices.time_in),
             )
         else:
-            try:
-                date_part, time_part = self._safe_get(raw, spec.indices.get("dt_in")).split()
-                month, day, year = map(int, date_part.split("/"))
-                reformatted_date = f"{year % 100:02d}{month:02d}{day:02d}"
-                reformatted_time = time_part.replace(":", "")
-                loaded_dt = self._parse_timestamp(
-                    reformatted_date,
-                    reformatted_time,
-                )
-            except Exception:
-                loaded_dt = None
+            loaded_dt = self._parse_datetime_text(self._safe_get(raw, indices.dt_in))
         
-        if "date_out" in spec.indices and "time_out" in spec.indices:
+        if indices.has_date_time_out:
             unloaded_dt = self._parse_timestamp(
-                self._safe_get(raw, spec.indices.get("date_out")),
-                self._safe_get(raw, spec.indices.get("time_out")),
+                self._safe_get(raw, indices.date_out),
+                self._safe_get(raw, indices.time_out),
             )
         else:
-            try:
-                date_part, time_part = self._safe_get(raw, spec.indices.get("dt_out")).split()
-                month, day, year = map(int, date_part.split("/"))
-                reformatted_date = f"{year % 100:02d}{month:02d}{day:02d}"
-                reformatted_time = time_part.replace(":", "")
-                unloaded_dt = self._parse_timestamp(
-                    reformatted_date,
-                    reformatted_time,
-                )
-            except Exception:
-                unloaded_dt = None
+            unloaded_dt = self._parse_datetime_text(self._safe_get(raw, indices.dt_out))
 
         if not loaded_dt or not unloaded_dt:
             return None
 
-        station_number_str = self._safe_get(raw, spec.indices.get("station"))
+        station_number_str = self._safe_get(raw, indices.station)
         station_number = self._to_int(station_number_str)
 
         station_type = ""
         if station_number is not None:
-            station_type = self.config.station_types.get(
-                (spec.lane, station_number),
-                ""
-            )
+            station_type = lane_types.get(station_number, "")
 
         if not station_type:
             return None
         
         actual_ah = ""
-        if station_type == "PLATE" and "actual_ah" not in spec.indices.values():
-            target_ah = self._safe_get(raw, spec.indices.get("target_ah"))
-            ah_pct = self._safe_get(raw, spec.indices.get("ah_pct"))
+        if station_type == "PLATE" and indices.derive_actual_ah:
+            target_ah = self._safe_get(raw, indices.target_ah)
+            ah_pct = self._safe_get(raw, indices.ah_pct)
             if target_ah and ah_pct:
                 try:
                     actual_ah_value = float(target_ah) * float(ah_pct)
@@ -382,78 +539,40 @@ class HoistAggregator:
                 except ValueError:
                     actual_ah = ""
         else:
-            actual_ah = self._safe_get(raw, spec.indices.get("actual_ah"))
-
-        return {
-            "Hoist #": spec.hoist,
-            "Lane Number": spec.lane,
-            "Station Number": station_number_str,
-            "Station Type": station_type,
-
-            "Date/Time Loaded": self._format_datetime(loaded_dt),
-            "Date/Time Unloaded": self._format_datetime(unloaded_dt),
-            "Duration": self._format_duration(loaded_dt, unloaded_dt),
-
-            "Customer": self._safe_get(raw, spec.indices.get("customer")),
-            "Part ID": self._safe_get(raw, spec.indices.get("part")),
-            "Shop Order": shop_order,
-            "Load Number": self._safe_get(raw, spec.indices.get("load")),
-            "Barrel Number": self._safe_get(raw, spec.indices.get("barrel")),
-
-            "Target Amp Hours":
-                self._safe_get(raw, spec.indices.get("target_ah"))
-                if station_type == "PLATE" else "",
-
-            "Actual Amp Hours":
-                actual_ah
-                if station_type == "PLATE" else "",
-
-            "Amp Hours Percent":
-                self._safe_get(raw, spec.indices.get("ah_pct"))
-                if station_type == "PLATE" else "",
-
-            "Barrel Speed": self._safe_get(raw, spec.indices.get("barrel_speed")),
-            "Target Weight": self._safe_get(raw, spec.indices.get("target_weight")),
-            "Actual Weight": self._safe_get(raw, spec.indices.get("actual_weight")),
-
-            "_sort": unloaded_dt,
-        }
+            actual_ah = self._safe_get(raw, indices.actual_ah)
+
+        return unloaded_dt, (
+            str(spec.hoist),
+            str(spec.lane),
+            station_number_str,
+            station_type,
+            self._format_datetime(loaded_dt),
+            self._format_datetime(unloaded_dt),
+            self._format_duration(loaded_dt, unloaded_dt),
+            self._safe_get(raw, indices.customer),
+            self._safe_get(raw, indices.part),
+            shop_order,
+            self._safe_get(raw, indices.load),
+            self._safe_get(raw, indices.barrel),
+            self._safe_get(raw, indices.target_ah)
+            if station_type == "PLATE" else "",
+            actual_ah if station_type == "PLATE" else "",
+            self._safe_get(raw, indices.ah_pct)
+            if station_type == "PLATE" else "",
+            self._safe_get(raw, indices.barrel_speed),
+            self._safe_get(raw, indices.target_weight),
+            self._safe_get(raw, indices.actual_weight),
+        )
 
-    def _write_output(self, rows: list[dict]) -> None:
+    def _write_output(self, rows: Iterable[tuple[str, ...]]) -> None:
         """Write aggregated hoist data to the configured output CSV file.
 
         Args:
-            rows (list[dict]): Normalized and sorted row dictionaries.
+            rows (Iterable[tuple[str, ...]]): Header and rows as yielded by
+                iter_rows.
         """
         with self.config.output_file.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "Hoist #",
-                    "Lane Number",
-                    "Station Number",
-                    "Station Type",
-                    "Date/Time Loaded",
-                    "Date/Time Unloaded",
-                    "Duration",
-                    "Customer",
-                    "Part ID",
-                    "Shop Order",
-                    "Load Number",
-                    "Barrel Number",
-                    "Target Amp Hours",
-                    "Actual Amp Hours",
-                    "Amp Hours Percent",
-                    "Barrel Speed",
-                    "Target Weight",
-                    "Actual Weight",
-                ],
-            )
-            writer.writeheader()
-
-            for row in rows:
-                row.pop("_sort", None)
-                writer.writerow(row)
+            csv.writer(f).writerows(rows)
 
     @staticmethod
     def _safe_get(row: list[str], index: Optional[int]) -> str:
@@ -496,15 +615,44 @@ class HoistAggregator:
         Returns:
             Optional[datetime]: Parsed datetime or None if parsing fails.
         """
-        if not date_str or not time_str:
+        if len(date_str) != 6 or not date_str.isdecimal():
+            return None
+        if not time_str or len(time_str) > 6 or not time_str.isdecimal():
             return None
+
+        # Fields are split off numerically rather than going through strptime,
+        # which also left-pads short times; two-digit years follow the same
+        # 1969-2068 pivot as %y.
+        year, rest = divmod(int(date_str), 10000)
+        month, day = divmod(rest, 100)
+        hour, rest = divmod(int(time_str), 10000)
+        minute, second = divmod(rest, 100)
+        year += 2000 if year < 69 else 1900
         try:
-            while len(time_str) < 6:
-                time_str = "0" + time_str
-            return datetime.strptime(f"{date_str}{time_str}", "%y%m%d%H%M%S")
+            return datetime(year, month, day, hour, minute, second)
         except ValueError:
             return None
 
+    @staticmethod
+    def _parse_datetime_text(value: str) -> Optional[datetime]:
+        """Parse an M/D/YYYY H:MM:SS timestamp into a datetime.
+
+        Args:
+            value (str): Date/time string, e.g. "3/7/2024 6:05:09".
+
+        Returns:
+            Optional[datetime]: Parsed datetime or None if parsing fails.
+        """
+        try:
+            date_part, time_part = value.split()
+            month, day, year = map(int, date_part.split("/"))
+            hour, minute, second = map(int, time_part.split(":"))
+            if year < 100:
+                year += 2000 if year < 69 else 1900
+            return datetime(year, month, day, hour, minute, second)
+        except (ValueError, OverflowError):
+            return None
+
     def _format_datetime(self, dt: datetime) -> str:
         """Format a datetime for CSV output.
 
@@ -540,7 +688,9 @@ class HoistExcelExporter:
 
     Reads a consolidated hoist CSV file and produces an Excel (.xlsx) file with
     predefined formatting, filters, column widths, and data types suitable for
-    analysis and reporting.
+    analysis and reporting. The workbook is built in openpyxl's write-only mode,
+    so rows are streamed to disk with their styles instead of being held in an
+    in-memory cell grid.
     
     Attributes:
         csv_path (Path): Path to the source CSV file.
@@ -570,6 +720,107 @@ class HoistExcelExporter:
     """Excel table style to apply to the worksheet."""
     TABLE_STYLE = "TableStyleMedium1"
 
+    """Column width, alignment, and number format settings by column name."""
+    COLUMN_CONFIG = {
+        "Hoist #": {
+            "width": 10,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "0"
+        },
+        "Lane Number": {
+            "width": 15,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "0"
+        },
+        "Station Number": {
+            "width": 15,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "0"
+        },
+        "Station Type": {
+            "width": 15,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "@"
+        },
+        "Date/Time Loaded": {
+            "width": 20,
+            "alignment": _ALIGN_LEFT,
+            "number_format": "mm/dd/yyyy hh:mm:ss"
+        },
+        "Date/Time Unloaded": {
+            "width": 20,
+            "alignment": _ALIGN_LEFT,
+            "number_format": "mm/dd/yyyy hh:mm:ss"
+        },
+        "Duration": {
+            "width": 12,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "[h]:mm:ss"
+        },
+        "Customer": {
+            "width": 12,
+            "alignment": _ALIGN_LEFT,
+            "number_format": "@"
+        },
+        "Part ID": {
+            "width": 25,
+            "alignment": _ALIGN_LEFT,
+            "number_format": "@"
+        },
+        "Shop Order": {
+            "width": 12,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "0"
+        },
+        "Load Number": {
+            "width": 12,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "0"
+        },
+        "Barrel Number": {
+            "width": 14,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "0"
+        },
+        "Target Amp Hours": {
+            "width": 18,
+            "alignment": _ALIGN_RIGHT,
+            "number_format": "0.0"
+        },
+        "Actual Amp Hours": {
+            "width": 18,
+            "alignment": _ALIGN_RIGHT,
+            "number_format": "0.0"
+        },
+        "Amp Hours Percent": {
+            "width": 18,
+            "alignment": _ALIGN_RIGHT,
+            "number_format": "0.00%"
+        },
+        "Barrel Speed": {
+            "width": 12,
+            "alignment": _ALIGN_CENTER,
+            "number_format": "0"
+        },
+        "Target Weight": {
+            "width": 14,
+            "alignment": _ALIGN_RIGHT,
+            "number_format": "0.0"
+        },
+        "Actual Weight": {
+            "width": 14,
+            "alignment": _ALIGN_RIGHT,
+            "number_format": "0.0"
+        },
+    }
+
+    """Settings for columns not listed in COLUMN_CONFIG."""
+    DEFAULT_COLUMN_CONFIG = {
+        "width": 12,
+        "alignment": _ALIGN_LEFT,
+        "number_format": "General"
+    }
+
     def __init__(self, csv_path: Path, xlsx_path: Path) -> None:
         """Initialize the Excel exporter.
 
@@ -580,91 +831,207 @@ class HoistExcelExporter:
         self.csv_path = csv_path
         self.xlsx_path = xlsx_path
 
-    def write(self) -> None:
+    def write(self, rows: Optional[Iterable[Sequence[str]]] = None) -> None:
         """Generate the Excel workbook from the CSV source.
 
-        Reads the CSV file, applies formatting and presentation rules, and writes
-        the resulting Excel workbook to disk.
+        Reads the CSV file, or the given rows in its place, applies formatting and
+        presentation rules, and writes the resulting Excel workbook to disk.
+
+        Args:
+            rows (Optional[Iterable[Sequence[str]]]): CSV-style rows, starting
+                with the header row, to export instead of reading csv_path.
         """
-        rows = self._read_csv()
-        workbook = self._create_workbook(rows)
+        source = self._read_csv() if rows is None else iter(rows)
+        workbook = self._create_workbook(source)
         workbook.save(self.xlsx_path)
 
-    def _read_csv(self) -> list[list[str]]:
-        """Read all rows from the CSV source file.
+    def _read_csv(self) -> Iterator[list[str]]:
+        """Read rows from the CSV source file one at a time.
 
-        Returns:
-            list[list[str]]: List of CSV rows.
+        The file stays open until the rows have been consumed.
+
+        Yields:
+            list[str]: CSV row values, starting with the header row.
         """
         with self.csv_path.open(newline="", encoding="utf-8") as f:
-            return list(csv.reader(f))
+            yield from csv.reader(f)
 
-    def _create_workbook(self, rows: list[list[str]]):
-        """Create and populate an Excel workbook from CSV rows.
+    def _create_workbook(self, rows: Iterator[Sequence[str]]):
+        """Create and populate a write-only Excel workbook from CSV rows.
+
+        Sheet-level settings (freeze panes, row height, column widths) are applied
+        before any rows are written, as write-only worksheets emit them first.
+        Each column's alignment and number format is registered once and copied
+        onto its cells as rows are streamed.
 
         Args:
-            rows (list[list[str]]): CSV data rows.
+            rows (Iterator[Sequence[str]]): CSV rows, starting with the header
+                row.
 
         Returns:
             Workbook: Populated Excel workbook.
         """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Hoist Data"
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Hoist Data")
+
+        header = next(rows)
+        widths, alignments, number_formats = self._build_column_arrays(header)
+
+        # Register each column's style with the workbook once. Cells then take a
+        # copy of the registered style ids instead of re-registering per cell.
+        columns = []
+        for col_name, alignment, number_format in zip(
+            header, alignments, number_formats
+        ):
+            template = WriteOnlyCell(ws)
+            template.alignment = alignment
+            template.number_format = number_format
+            columns.append((self._pick_converter(col_name), template._style))
+
+        self._apply_filters(ws)
+        self._format_rows(ws)
+        self._format_columns(ws, widths)
 
-        header = rows[0]
-        ws.append(header)
+        header_cells = []
+        for col_name, alignment in zip(header, alignments):
+            cell = WriteOnlyCell(ws, value=col_name)
+            cell.alignment = alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
 
-        for row in rows[1:]:
+        last_row = 1
+        for row in rows:
             converted_row = []
-            for col_idx, value in enumerate(row):
-                col_name = header[col_idx] if col_idx < len(header) else ""
-                converted_row.append(self._convert_value(value, col_name))
+            for value, (convert, style) in zip(row, columns):
+                cell = WriteOnlyCell(ws, value=convert(value))
+                cell._style = copy(style)
+                converted_row.append(cell)
             ws.append(converted_row)
+            last_row += 1
 
-        self._apply_filters(ws)
-        self._apply_table(ws)
-        self._format_rows(ws)
-        self._format_columns(ws, header)
-        self._apply_conditional_formatting(ws, header)
+        self._apply_table(ws, header, last_row)
+        self._apply_conditional_formatting(ws, header, last_row)
 
         return wb
-    
-    def _convert_value(self, value: str, col_name: str):
-        """Convert a CSV string value to the appropriate Python type.
+
+    @classmethod
+    def _build_column_arrays(
+        cls, header: list[str]
+    ) -> tuple[tuple[int, ...], tuple[Alignment, ...], tuple[str, ...]]:
+        """Resolve column settings into parallel tuples indexed by column position.
+
+        Args:
+            header (list[str]): Column header names.
+
+        Returns:
+            tuple[tuple[int, ...], tuple[Alignment, ...], tuple[str, ...]]: Column
+                widths, alignments, and number formats.
+        """
+        configs = [
+            cls.COLUMN_CONFIG.get(col_name, cls.DEFAULT_COLUMN_CONFIG)
+            for col_name in header
+        ]
+        return (
+            tuple(config["width"] for config in configs),
+            tuple(config["alignment"] for config in configs),
+            tuple(config["number_format"] for config in configs),
+        )
+
+    def _pick_converter(self, col_name: str) -> Callable[[str], Any]:
+        """Select the value converter for a column.
 
         Args:
-            value (str): The string value from CSV.
             col_name (str): The column name to determine type.
 
         Returns:
-            The converted value (int, float, datetime, or str).
+            Callable[[str], Any]: Converter function for the column's values.
         """
-        if not value or value.strip() == "":
-            return ""
+        if col_name in self.DATETIME_COLUMNS:
+            return self._converter(self._parse_datetime)
+        if col_name in self.INTEGER_COLUMNS:
+            return self._converter(int)
+        if col_name in self.FLOAT_COLUMNS or col_name in self.PERCENTAGE_COLUMNS:
+            return self._converter(float)
+        if col_name == "Duration":
+            return self._converter(self._parse_duration)
+        return self._convert_text
 
-        try:
-            if col_name in self.DATETIME_COLUMNS:
-                return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-            elif col_name in self.INTEGER_COLUMNS:
-                return int(value)
-            elif col_name in self.FLOAT_COLUMNS or col_name in self.PERCENTAGE_COLUMNS:
-                return float(value)
-            elif col_name == "Duration":
-                is_negative = value.startswith("-")
-                clean_value = value.lstrip("-")
-                parts = clean_value.split(":")
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                seconds = int(parts[2])
-                total_seconds = hours * 3600 + minutes * 60 + seconds
-                duration_days = total_seconds / 86400
-                return -duration_days if is_negative else duration_days
-        except (ValueError, TypeError):
-            pass
+    @staticmethod
+    def _converter(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+        """Wrap a parser to convert a CSV string value to a Python type.
+
+        Blank values become empty strings, and values the parser rejects are
+        returned unchanged.
+
+        Args:
+            parse (Callable[[str], Any]): Parser for non-blank values.
+
+        Returns:
+            Callable[[str], Any]: Converter function.
+        """
+        def convert(value: str):
+            if not value or value.isspace():
+                return ""
+            try:
+                return parse(value)
+            except (ValueError, TypeError):
+                return value
+
+        return convert
+
+    @staticmethod
+    def _convert_text(value: str) -> str:
+        """Convert a CSV string value for a text column.
 
+        Args:
+            value (str): The string value from CSV.
+
+        Returns:
+            str: The value, or an empty string if blank.
+        """
+        if not value or value.isspace():
+            return ""
         return value
 
+    @staticmethod
+    def _parse_datetime(value: str) -> datetime:
+        """Parse a datetime value written by the aggregator.
+
+        The aggregator always writes this fixed-width ISO 8601 format, so the
+        value is handed to datetime.fromisoformat instead of strptime.
+
+        Args:
+            value (str): Datetime string in YYYY-MM-DD HH:MM:SS format.
+
+        Returns:
+            datetime: Parsed datetime.
+
+        Raises:
+            ValueError: If the value is not in the expected format.
+        """
+        if len(value) != 19:
+            raise ValueError(f"Invalid datetime value: {value!r}")
+        return datetime.fromisoformat(value)
+
+    @staticmethod
+    def _parse_duration(value: str) -> float:
+        """Parse an H:MM:SS duration into a fraction of days.
+
+        Args:
+            value (str): Duration string, optionally prefixed with "-".
+
+        Returns:
+            float: Duration in days, as used by Excel time formats.
+
+        Raises:
+            ValueError: If the value does not have exactly three fields.
+        """
+        if value[0] == "-":
+            hours, minutes, seconds = value[1:].split(":")
+            return -(int(hours) * 3600 + int(minutes) * 60 + int(seconds)) / 86400
+        hours, minutes, seconds = value.split(":")
+        return (int(hours) * 3600 + int(minutes) * 60 + int(seconds)) / 86400
+
     def _apply_filters(self, ws) -> None:
         """Enable column filters and freeze the header row.
 
@@ -673,13 +1040,27 @@ class HoistExcelExporter:
         """
         ws.freeze_panes = "A2"
 
-    def _apply_table(self, ws) -> None:
+    def _apply_table(self, ws, header: list[str], last_row: int) -> None:
         """Apply Excel table styling to the worksheet.
 
+        Write-only worksheets cannot read back their header cells, so the table
+        columns and filter range are defined explicitly.
+
         Args:
             ws: Worksheet to modify.
+            header (list[str]): Column header names.
+            last_row (int): Last row number written to the worksheet.
         """
-        table = Table(displayName="HoistAggregation", ref=ws.dimensions)
+        ref = f"A1:{get_column_letter(len(header))}{last_row}"
+        table = Table(
+            displayName="HoistAggregation",
+            ref=ref,
+            autoFilter=AutoFilter(ref=ref),
+            tableColumns=[
+                TableColumn(id=col_idx, name=col_name)
+                for col_idx, col_name in enumerate(header, start=1)
+            ],
+        )
         style = TableStyleInfo(
             name=self.TABLE_STYLE,
             showFirstColumn=False,
@@ -688,175 +1069,61 @@ class HoistExcelExporter:
             showColumnStripes=False,
         )
         table.tableStyleInfo = style
-        ws.add_table(table)
+
+        # openpyxl warns about manual table columns in write-only mode
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            ws.add_table(table)
 
     def _format_rows(self, ws) -> None:
         """Apply row height to all rows.
 
+        Uses the sheet's default row height rather than per-row dimensions.
+        customHeight marks the default as deliberate so Excel does not fall back
+        to its own.
+
         Args:
             ws: Worksheet to modify.
         """
-        for row_num in range(1, ws.max_row + 1):
-            ws.row_dimensions[row_num].height = 21
+        ws.sheet_format.defaultRowHeight = 21
+        ws.sheet_format.customHeight = True
+
+    def _format_columns(self, ws, widths: tuple[int, ...]) -> None:
+        """Apply column widths.
 
-    def _format_columns(self, ws, header: list[str]) -> None:
-        """Apply column widths and number formatting.
+        Alignment and number formatting are applied per cell as rows are written.
 
         Args:
             ws: Worksheet to modify.
-            header (list[str]): Column header names.
+            widths (tuple[int, ...]): Column widths, indexed by column position.
         """
-        # Define column-specific settings
-        column_config = {
-            "Hoist #": {
-                "width": 10,
-                "alignment": "center",
-                "number_format": "0"
-            },
-            "Lane Number": {
-                "width": 15,
-                "alignment": "center",
-                "number_format": "0"
-            },
-            "Station Number": {
-                "width": 15,
-                "alignment": "center",
-                "number_format": "0"
-            },
-            "Station Type": {
-                "width": 15,
-                "alignment": "center",
-                "number_format": "@"
-            },
-            "Date/Time Loaded": {
-                "width": 20,
-                "alignment": "left",
-                "number_format": "mm/dd/yyyy hh:mm:ss"
-            },
-            "Date/Time Unloaded": {
-                "width": 20,
-                "alignment": "left",
-                "number_format": "mm/dd/yyyy hh:mm:ss"
-            },
-            "Duration": {
-                "width": 12,
-                "alignment": "center",
-                "number_format": "[h]:mm:ss"
-            },
-            "Customer": {
-                "width": 12,
-                "alignment": "left",
-                "number_format": "@"
-            },
-            "Part ID": {
-                "width": 25,
-                "alignment": "left",
-                "number_format": "@"
-            },
-            "Shop Order": {
-                "width": 12,
-                "alignment": "center",
-                "number_format": "0"
-            },
-            "Load Number": {
-                "width": 12,
-                "alignment": "center",
-                "number_format": "0"
-            },
-            "Barrel Number": {
-                "width": 14,
-                "alignment": "center",
-                "number_format": "0"
-            },
-            "Target Amp Hours": {
-                "width": 18,
-                "alignment": "right",
-                "number_format": "0.0"
-            },
-            "Actual Amp Hours": {
-                "width": 18,
-                "alignment": "right",
-                "number_format": "0.0"
-            },
-            "Amp Hours Percent": {
-                "width": 18,
-                "alignment": "right",
-                "number_format": "0.00%"
-            },
-            "Barrel Speed": {
-                "width": 12,
-                "alignment": "center",
-                "number_format": "0"
-            },
-            "Target Weight": {
-                "width": 14,
-                "alignment": "right",
-                "number_format": "0.0"
-            },
-            "Actual Weight": {
-                "width": 14,
-                "alignment": "right",
-                "number_format": "0.0"
-            },
-        }
+        for col_idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
 
-        for col_idx, col_name in enumerate(header, start=1):
-            column_letter = get_column_letter(col_idx)
-            
-            # Get configuration for this column
-            config = column_config.get(col_name, {
-                "width": 12,
-                "alignment": "left",
-                "number_format": "General"
-            })
-
-            # Set column width
-            ws.column_dimensions[column_letter].width = config["width"]
-
-            # Apply formatting to cells
-            ws[column_letter][0].alignment = Alignment(
-                horizontal=config["alignment"],
-                vertical='center'
-            )
-            cells = ws[column_letter][1:]
-            for cell in cells:
-                cell.number_format = config["number_format"]
-                cell.alignment = Alignment(
-                    horizontal=config["alignment"],
-                    vertical='center'
-                )
-
-    def _apply_conditional_formatting(self, ws, header: list[str]) -> None:
+    def _apply_conditional_formatting(
+        self, ws, header: list[str], last_row: int
+    ) -> None:
         """Apply conditional formatting rules.
 
         Args:
             ws: Worksheet to modify.
             header (list[str]): Column header names.
+            last_row (int): Last row number written to the worksheet.
         """
         # Find the Amp Hours Percent column
         try:
             amp_hours_col_idx = header.index("Amp Hours Percent") + 1
             amp_hours_col_letter = get_column_letter(amp_hours_col_idx)
             
-            # Define the range (skip header row, go to max row)
-            range_str = f"{amp_hours_col_letter}2:{amp_hours_col_letter}{ws.max_row}"
+            # Define the range (skip header row, go to last row)
+            range_str = f"{amp_hours_col_letter}2:{amp_hours_col_letter}{last_row}"
             
-            # Red bold font for values < 90%
+            # Red bold font for values < 90% or > 110%, as one rule relative to
+            # the first cell in the range
+            top = f"{amp_hours_col_letter}2"
             red_bold_font = Font(color="FF0000", bold=True)
-            rule_low = CellIsRule(
-                operator='lessThan',
-                formula=['0.9'],
-                font=red_bold_font
-            )
-            ws.conditional_formatting.add(range_str, rule_low)
-            
-            # Red bold font for values > 110%
-            rule_high = CellIsRule(
-                operator='greaterThan',
-                formula=['1.1'],
-                font=red_bold_font
-            )
-            ws.conditional_formatting.add(range_str, rule_high)
+            rule = FormulaRule(formula=[f"OR({top}<0.9,{top}>1.1)"], font=red_bold_font)
+            ws.conditional_formatting.add(range_str, rule)
             
         except ValueError:
             # Column not found, skip conditional formatting
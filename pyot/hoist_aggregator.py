@@ -5,16 +5,17 @@ def main():
     app_config = get_settings()
     config = app_config.push_to_server.hoist_aggregation
 
-    aggregator = HoistAggregator(config)
-    aggregator.run()
+    if not config.enabled:
+        return
 
+    # Rows go straight from the aggregator into the workbook; the CSV file is
+    # only written when HoistAggregator.run() is called on its own.
+    aggregator = HoistAggregator(config)
     exporter = HoistExcelExporter(
         config.output_file,
         config.output_file.with_suffix(".xlsx"),
     )
-    exporter.write()
-
-    config.output_file.unlink()
+    exporter.write(aggregator.iter_rows())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
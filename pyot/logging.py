@@ -1,8 +1,15 @@
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import time as dtime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+# Log records never include thread or process details, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 
 def setup_logger(
@@ -18,7 +25,8 @@ def setup_logger(
 
     Configure a logger that writes to logs/<scriptname>.log,
     rotates daily at midnight, and keeps 'backup_count' days.
-    Console output happens only when level == DEBUG.
+    Console output happens only when level == DEBUG. Records are handed to a
+    background listener thread, so callers never wait on file or console I/O.
 
     Args:
         name: Logger name.
@@ -48,6 +56,12 @@ def setup_logger(
     if logger.handlers:
         for h in list(logger.handlers):
             logger.removeHandler(h)
+            listener = getattr(h, "listener", None)
+            if listener is not None:
+                atexit.unregister(listener.stop)
+                listener.stop()
+                for target in listener.handlers:
+                    target.close()
             h.close()
 
     # Log message format
@@ -67,14 +81,23 @@ def setup_logger(
     file_handler.suffix = "%Y-%m-%d"
     file_handler.setFormatter(fmt)
     file_handler.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
+    handlers: list[logging.Handler] = [file_handler]
 
     # Configure console handler for DEBUG level
     if level == logging.DEBUG:
         console = logging.StreamHandler(sys.stdout)
         console.setFormatter(fmt)
         console.setLevel(logging.DEBUG)
-        logger.addHandler(console)
+        handlers.append(console)
+
+    # Route records through a queue to a listener thread that does the writing
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.listener = listener
+    logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(listener.stop)
 
     # Return the configured logger
     return logger
@@ -6,10 +6,13 @@ import socket
 import ssl
 import threading
 import uuid
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, NamedTuple, Optional, Union
 
 import paho.mqtt.client as mqtt
-from paho.mqtt.client import Client, MQTTMessage, topic_matches_sub
+from paho.mqtt.client import Client, MQTTMessage
+from paho.mqtt.matcher import MQTTMatcher
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.properties import Properties
 
 from pyot.config import BrokerConfig
 
@@ -17,6 +20,25 @@ MessageHandler = Callable[[str, bytes], None]
 ConnectHandler = Callable[[], None]
 DisconnectHandler = Callable[[int], None]
 
+# Maximum number of concrete topics whose matched handler is remembered
+_MATCH_CACHE_SIZE = 4096
+
+
+class _RouteTable(NamedTuple):
+    """Read-only snapshot of the subscriptions used to route incoming messages.
+
+    Attributes:
+        matcher: Topic trie of subscribed filters, valued by match priority.
+        handlers: Handler for each subscribed filter.
+        default: Default message handler for topics without a filter handler.
+        cache: Resolved handler by concrete topic for this snapshot.
+    """
+
+    matcher: MQTTMatcher
+    handlers: dict[str, Optional[MessageHandler]]
+    default: Optional[MessageHandler]
+    cache: dict[str, Optional[MessageHandler]]
+
 
 class MQTTClient:
     """Wrapper around paho-mqtt client.
@@ -38,6 +60,12 @@ class MQTTClient:
         on_connect: Optional[ConnectHandler] = None,
         on_disconnect: Optional[DisconnectHandler] = None,
         logger: Optional[logging.Logger] = None,
+        tcp_nodelay: bool = True,
+        sndbuf: Optional[int] = None,
+        rcvbuf: Optional[int] = None,
+        client_id: Optional[str] = None,
+        session_expiry: Optional[int] = None,
+        transport: str = "tcp",
     ) -> None:
         """Constructor.
 
@@ -53,6 +81,20 @@ class MQTTClient:
             on_connect: Optional connect handler().
             on_disconnect: Optional disconnect handler(reason_code).
             logger: Optional logger. If None, uses a module-level logger with NullHandler.
+            tcp_nodelay: Disable Nagle's algorithm on the broker socket so small
+                packets are sent immediately (default True).
+            sndbuf: Optional socket send buffer size in bytes (SO_SNDBUF). If None,
+                the operating system default is kept.
+            rcvbuf: Optional socket receive buffer size in bytes (SO_RCVBUF). If
+                None, the operating system default is kept.
+            client_id: Optional MQTT client id. If None, one is generated from the
+                hostname, process id, and a random suffix.
+            session_expiry: Optional session expiry interval in seconds. If set,
+                the broker keeps the session across reconnects for that long, and
+                filters it still holds are not subscribed again.
+            transport: "tcp" (default), "websockets", or "unix". With "unix", host
+                is the path of the broker's Unix domain socket, which avoids the
+                loopback TCP stack when the broker runs on the same machine.
         """
 
         # Store connection params
@@ -60,6 +102,11 @@ class MQTTClient:
         self.port = port
         self.keepalive = keepalive
         self.qos = qos
+        self.tcp_nodelay = tcp_nodelay
+        self.sndbuf = sndbuf
+        self.rcvbuf = rcvbuf
+        self.session_expiry = session_expiry
+        self.transport = transport
 
         # External logger or a no-op logger
         self.log = logger or logging.getLogger(__name__)
@@ -75,10 +122,19 @@ class MQTTClient:
         self._routes: dict[str, Optional[MessageHandler]] = {}
         self._route_qos: dict[str, int] = {}
 
+        # Snapshot of the routes read by the message thread without locking
+        self._route_table = _RouteTable(MQTTMatcher(), {}, on_message, {})
+
+        # Filters subscribed in the current broker session
+        self._session_filters: set[str] = set()
+
         # Build client
+        if client_id is None:
+            client_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
         self._client = mqtt.Client(
-            client_id=f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}",
+            client_id=client_id,
             protocol=mqtt.MQTTv5,
+            transport=transport,
         )
         if username:
             self._client.username_pw_set(username, password)
@@ -96,6 +152,7 @@ class MQTTClient:
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
         self._client.on_message = self._on_message
+        self._client.on_socket_open = self._on_socket_open
 
         # Initialize state
         self._loop_running = False
@@ -124,16 +181,23 @@ class MQTTClient:
             # Store the handler and QoS for this filter
             self._routes[topic_filter] = handler
             self._route_qos[topic_filter] = self.qos if qos is None else qos
+            self._publish_routes()
 
             # If already connected, subscribe immediately
             if self._loop_running:
                 q = self._route_qos[topic_filter]
                 self.log.info("MQTT subscribing to %s (qos=%d)", topic_filter, q)
                 result, _ = self._client.subscribe(topic_filter, qos=q)
-                if result != mqtt.MQTT_ERR_SUCCESS:
-                    self.log.error(
-                        "Failed to subscribe to %s: code=%s", topic_filter, result
-                    )
+                if result == mqtt.MQTT_ERR_SUCCESS:
+                    self._session_filters.add(topic_filter)
+                    return
+                self.log.error(
+                    "Failed to subscribe to %s: code=%s", topic_filter, result
+                )
+
+            # Not sent, so the next connect subscribes it again with this QoS
+            # even if a resumed session still holds the old subscription
+            self._session_filters.discard(topic_filter)
 
     def unsubscribe(self, topic_filter: str) -> None:
         """Unsubscribe and remove any handler for the given filter.
@@ -145,18 +209,25 @@ class MQTTClient:
             if topic_filter in self._routes:
                 del self._routes[topic_filter]
                 self._route_qos.pop(topic_filter, None)
+                self._publish_routes()
                 if self._loop_running:
-                    self._client.unsubscribe(topic_filter)
+                    result, _ = self._client.unsubscribe(topic_filter)
+                    if result == mqtt.MQTT_ERR_SUCCESS:
+                        self._session_filters.discard(topic_filter)
                     self.log.info("MQTT unsubscribed from %s", topic_filter)
 
     def clear_subscriptions(self) -> None:
         """Remove all subscriptions and handlers."""
         with self._lock:
             if self._loop_running and self._routes:
-                for f in list(self._routes.keys()):
-                    self._client.unsubscribe(f)
+                # One UNSUBSCRIBE packet for every filter
+                filters = list(self._routes)
+                result, _ = self._client.unsubscribe(filters)
+                if result == mqtt.MQTT_ERR_SUCCESS:
+                    self._session_filters.difference_update(filters)
             self._routes.clear()
             self._route_qos.clear()
+            self._publish_routes()
 
     def start(self) -> None:
         """
@@ -166,8 +237,17 @@ class MQTTClient:
             if self._loop_running:
                 return
             self.log.info("MQTT connecting to %s:%s", self.host, self.port)
+            properties = None
+            if self.session_expiry is not None:
+                properties = Properties(PacketTypes.CONNECT)
+                properties.SessionExpiryInterval = self.session_expiry
             try:
-                self._client.connect(self.host, self.port, keepalive=self.keepalive)
+                self._client.connect(
+                    self.host,
+                    self.port,
+                    keepalive=self.keepalive,
+                    properties=properties,
+                )
             except Exception as e:
                 self.log.exception("MQTT initial connect failed: %s", e)
             self._client.loop_start()
@@ -207,7 +287,8 @@ class MQTTClient:
             MQTTMessageInfo object for the publish request.
         """
         q = self.qos if qos is None else qos
-        self.log.debug("MQTT publish topic=%s qos=%s retain=%s", topic, q, retain)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("MQTT publish topic=%s qos=%s retain=%s", topic, q, retain)
         return self._client.publish(topic, payload=payload, qos=q, retain=retain)
 
     def _on_connect(
@@ -229,14 +310,34 @@ class MQTTClient:
             extra: Additional arguments.
         """
         if reason_code == 0:
-            self.log.debug("MQTT connected")
+            session_present = bool(flags.get("session present"))
+            self.log.debug("MQTT connected (session present=%s)", session_present)
             with self._lock:
-                for filt, q in self._route_qos.items():
-                    self.log.debug("MQTT subscribing to %s (qos=%d)", filt, q)
-                    result, _ = client.subscribe(filt, qos=q)
-                    if result != mqtt.MQTT_ERR_SUCCESS:
+
+                # A resumed session keeps its subscriptions, so only reconcile
+                # filters that changed while disconnected
+                if not session_present:
+                    self._session_filters.clear()
+                for filt in self._session_filters - self._route_qos.keys():
+                    result, _ = client.unsubscribe(filt)
+                    if result == mqtt.MQTT_ERR_SUCCESS:
+                        self._session_filters.discard(filt)
+
+                # Subscribe to the remaining filters with one SUBSCRIBE packet
+                pending = [
+                    (filt, q)
+                    for filt, q in self._route_qos.items()
+                    if filt not in self._session_filters
+                ]
+                if pending:
+                    filters = ", ".join(f"{filt} (qos={q})" for filt, q in pending)
+                    self.log.debug("MQTT subscribing to %s", filters)
+                    result, _ = client.subscribe(pending)
+                    if result == mqtt.MQTT_ERR_SUCCESS:
+                        self._session_filters.update(filt for filt, _ in pending)
+                    else:
                         self.log.error(
-                            "Failed to subscribe to %s: code=%s", filt, result
+                            "Failed to subscribe to %s: code=%s", filters, result
                         )
         else:
             self.log.warning(
@@ -248,6 +349,35 @@ class MQTTClient:
             except Exception:
                 self.log.exception("Error in user on_connect handler")
 
+    def _on_socket_open(self, client: Client, userdata: Any, sock: Any) -> None:
+        """Internal socket-open handler that applies socket options.
+
+        Paho calls this for every new broker connection, before the CONNECT
+        packet is sent, so the options also apply after a reconnect.
+
+        Args:
+            client: The client instance for this callback.
+            userdata: The private user data as set in Client() or userdata_set().
+            sock: The socket that was just opened.
+        """
+        options = []
+        if self.tcp_nodelay and self.transport == "tcp":
+            options.append(("TCP_NODELAY", socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+        if self.sndbuf is not None:
+            options.append(
+                ("SO_SNDBUF", socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+            )
+        if self.rcvbuf is not None:
+            options.append(
+                ("SO_RCVBUF", socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+            )
+
+        for name, level, option, value in options:
+            try:
+                sock.setsockopt(level, option, value)
+            except (AttributeError, OSError) as e:
+                self.log.warning("MQTT could not set %s: %s", name, e)
+
     def _on_disconnect(
         self,
         client: Client,
@@ -291,8 +421,9 @@ class MQTTClient:
             userdata: The private user data as set in Client() or userdata_set().
             msg: The received MQTTMessage.
         """
-        self.log.debug("MQTT message topic=%s payload=%r", msg.topic, msg.payload)
-        handler = self._match_handler(msg.topic) or self._user_on_message
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("MQTT message topic=%s payload=%r", msg.topic, msg.payload)
+        handler = self._match_handler(msg.topic)
         if handler:
             threading.Thread(
                 target=self._run_handler_safe,
@@ -316,25 +447,72 @@ class MQTTClient:
         Return the handler for the *most specific* matching subscription filter.
         If multiple filters match, prefer the most specific (fewest wildcards, longest).
 
+        Falls back to the default on_message handler when no filter with a handler
+        matches.
+
+        Matching walks the topic trie level by level, so only filters that can
+        match the topic are visited. Results are cached per topic until the
+        subscriptions or the default handler change. The current route snapshot
+        is read without taking the lock; only the MQTT network thread calls this
+        method.
+
         Args:
             topic: The topic of the incoming message.
 
         Returns:
-            The matched handler, or None if no match.
+            The handler to run, or None if there is none.
         """
-        best_filter = None
-        best_score = (-1, -1)
-        with self._lock:
-            for filt, h in self._routes.items():
-                if topic_matches_sub(filt, topic):
-                    non_wildcards = sum(
-                        1 for part in filt.split("/") if part not in ("#", "+")
-                    )
-                    score = (non_wildcards, len(filt))
-                    if score > best_score:
-                        best_score = score
-                        best_filter = filt
-            return self._routes.get(best_filter) if best_filter is not None else None
+        table = self._route_table
+        try:
+            return table.cache[topic]
+        except KeyError:
+            pass
+
+        best = max(table.matcher.iter_match(topic), default=None)
+        handler = table.handlers.get(best[3]) if best is not None else None
+        if handler is None:
+            handler = table.default
+
+        if len(table.cache) >= _MATCH_CACHE_SIZE:
+            table.cache.clear()
+        table.cache[topic] = handler
+        return handler
+
+    def _publish_routes(self) -> None:
+        """Replace the route snapshot after the subscriptions or default handler
+        have changed.
+
+        Must be called with the lock held. The new snapshot is built in full
+        before it is swapped in, so the message thread sees either the old or
+        the new routes, never a partial update.
+        """
+        matcher = MQTTMatcher()
+        for seq, topic_filter in enumerate(self._routes):
+            matcher[topic_filter] = self._filter_priority(topic_filter, seq)
+        self._route_table = _RouteTable(
+            matcher, dict(self._routes), self._user_on_message, {}
+        )
+
+    @staticmethod
+    def _filter_priority(topic_filter: str, seq: int) -> tuple[int, int, int, str]:
+        """Compute the match priority of a subscription filter.
+
+        Filters with more non-wildcard levels win, then longer filters. Any
+        remaining tie goes to the filter subscribed first. The filter itself
+        identifies the route.
+
+        Args:
+            topic_filter: MQTT topic filter.
+            seq: Position of the filter in subscription order.
+
+        Returns:
+            Tuple of (non-wildcard level count, filter length, negated
+            subscription position, filter).
+        """
+        non_wildcards = sum(
+            1 for part in topic_filter.split("/") if part not in ("#", "+")
+        )
+        return (non_wildcards, len(topic_filter), -seq, topic_filter)
 
     def set_on_message(self, handler: Optional[MessageHandler]) -> "MQTTClient":
         """Attach/replace the default message handler.
@@ -347,6 +525,7 @@ class MQTTClient:
         """
         with self._lock:
             self._user_on_message = handler
+            self._publish_routes()
         return self
 
     def set_on_connect(self, handler: Optional[ConnectHandler]) -> "MQTTClient":
@@ -2,8 +2,10 @@ import json
 import logging
 import os
 import socket
+import threading
 import time
 from datetime import datetime
+from typing import Optional
 
 import psutil
 
@@ -38,9 +40,65 @@ class Tracker:
         self.pid = os.getpid()
         self.process = psutil.Process(self.pid)
 
-        # Initialize tracking variables.
-        self.process_start = time.time()
-        self.last_heartbeat = 0
+        # Resolve heartbeat settings once.
+        self._topic = f"{config.HEARTBEAT_TOPIC}/{self.hostname}"
+        self._qos = config.HEARTBEAT_QOS
+        self._retain = config.HEARTBEAT_RETAIN
+        self._interval = config.HEARTBEAT_INTERVAL
+
+        # Pre-serialize the heartbeat fields that never change.
+        self._payload_head = f'{{"hostname": {json.dumps(self.hostname)}, '
+        self._payload_tail = (
+            f', "pid": {self.pid}, '
+            f'"version": {json.dumps(self.config.CURRENT_VERSION)}}}'
+        )
+
+        # Initialize tracking variables. Times come from the monotonic clock so
+        # wall-clock adjustments cannot skip or repeat heartbeats, and the first
+        # call to track() always publishes.
+        self.process_start = time.monotonic()
+        self.last_heartbeat = self.process_start - self._interval
+
+        # Background heartbeat thread state.
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start publishing heartbeats from a background thread.
+
+        A heartbeat is published right away if one is due, then once every
+        heartbeat interval until stop() is called. Callers no longer need to
+        poll track() from their own loop.
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pyot-heartbeat", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background heartbeat thread and wait for it to exit."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Publish heartbeats until the stop event is set.
+
+        Sleeps on the stop event until the next heartbeat is due, so stop() takes
+        effect immediately instead of after a full interval.
+        """
+        while not self._stop_event.is_set():
+            try:
+                self.track()
+            except Exception:
+                self.log.exception("Error publishing heartbeat")
+            delay = self.last_heartbeat + self._interval - time.monotonic()
+            self._stop_event.wait(max(delay, 0.0))
 
     def track(self) -> None:
         """Track and publish heartbeat.
@@ -50,33 +108,25 @@ class Tracker:
         to the MQTT broker.
         """
 
-        now = time.time()
+        now = time.monotonic()
 
         # Publish heartbeat if interval has passed.
-        if now - self.last_heartbeat >= self.config.HEARTBEAT_INTERVAL:
+        if now - self.last_heartbeat >= self._interval:
             self.last_heartbeat = now
 
             # Gather system and process information.
             uptime = int(now - self.process_start)
             memory = self.process.memory_info().rss
 
-            # Construct payload.
-            payload = json.dumps(
-                {
-                    "hostname": self.hostname,
-                    "timestamp": datetime.now().isoformat(),
-                    "uptime": uptime,
-                    "memory": memory,
-                    "pid": self.pid,
-                    "version": self.config.CURRENT_VERSION,
-                }
+            # Construct payload around the pre-serialized fields. The result is
+            # the same JSON json.dumps would produce for the full dict.
+            payload = (
+                f'{self._payload_head}"timestamp": "{datetime.now().isoformat()}", '
+                f'"uptime": {uptime}, "memory": {memory}{self._payload_tail}'
             )
 
             # Publish heartbeat payload.
             self.client.publish(
-                f"{self.config.HEARTBEAT_TOPIC}/{self.hostname}",
-                payload,
-                qos=self.config.HEARTBEAT_QOS,
-                retain=self.config.HEARTBEAT_RETAIN,
+                self._topic, payload, qos=self._qos, retain=self._retain
             )
-            self.log.debug(f"Published heartbeat: {payload}")
+            self.log.debug("Published heartbeat: %s", payload)